@@ -21,6 +21,7 @@ from select_ai._abc import SelectAIDataClass
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT,
     GET_USER_AI_AGENT_ATTRIBUTES,
+    LIST_USER_AI_AGENT_ATTRIBUTES,
     LIST_USER_AI_AGENTS,
 )
 from select_ai.db import async_cursor, cursor
@@ -245,6 +246,17 @@ class Agent(BaseAgent):
         :return: Iterator[Agent]
         """
         with cursor() as cr:
+            # Fetch attributes of all matching agents in a single query
+            # instead of one query per agent
+            cr.execute(
+                LIST_USER_AI_AGENT_ATTRIBUTES,
+                agent_name_pattern=agent_name_pattern,
+            )
+            agents_attributes = {}
+            for agent_name, k, v in cr.fetchall():
+                if isinstance(v, oracledb.LOB):
+                    v = v.read()
+                agents_attributes.setdefault(agent_name, {})[k] = v
             cr.execute(
                 LIST_USER_AI_AGENTS,
                 agent_name_pattern=agent_name_pattern,
@@ -255,7 +267,13 @@ class Agent(BaseAgent):
                     description = row[1].read()  # Oracle.LOB
                 else:
                     description = None
-                attributes = cls._get_attributes(agent_name=agent_name)
+                if agent_name in agents_attributes:
+                    attributes = AgentAttributes(
+                        **agents_attributes[agent_name]
+                    )
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = cls._get_attributes(agent_name=agent_name)
                 yield cls(
                     agent_name=agent_name,
                     description=description,
@@ -476,6 +494,17 @@ class AsyncAgent(BaseAgent):
         :return: AsyncGenerator[AsyncAgent]
         """
         async with async_cursor() as cr:
+            # Fetch attributes of all matching agents in a single query
+            # instead of one query per agent
+            await cr.execute(
+                LIST_USER_AI_AGENT_ATTRIBUTES,
+                agent_name_pattern=agent_name_pattern,
+            )
+            agents_attributes = {}
+            for agent_name, k, v in await cr.fetchall():
+                if isinstance(v, oracledb.AsyncLOB):
+                    v = await v.read()
+                agents_attributes.setdefault(agent_name, {})[k] = v
             await cr.execute(
                 LIST_USER_AI_AGENTS,
                 agent_name_pattern=agent_name_pattern,
@@ -487,7 +516,15 @@ class AsyncAgent(BaseAgent):
                     description = await row[1].read()  # Oracle.AsyncLOB
                 else:
                     description = None
-                attributes = await cls._get_attributes(agent_name=agent_name)
+                if agent_name in agents_attributes:
+                    attributes = AgentAttributes(
+                        **agents_attributes[agent_name]
+                    )
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = await cls._get_attributes(
+                        agent_name=agent_name
+                    )
                 yield cls(
                     agent_name=agent_name,
                     description=description,
@@ -24,6 +24,12 @@ from USER_AI_AGENTS a
 where REGEXP_LIKE(a.agent_name, :agent_name_pattern, 'i')
 """
 
+LIST_USER_AI_AGENT_ATTRIBUTES = """
+SELECT agent_name, attribute_name, attribute_value
+FROM USER_AI_AGENT_ATTRIBUTES
+WHERE REGEXP_LIKE(agent_name, :agent_name_pattern, 'i')
+"""
+
 GET_USER_AI_AGENT_TASK = """
 SELECT t.task_name, t.description
 FROM USER_AI_AGENT_TASKS t
@@ -42,6 +48,12 @@ FROM USER_AI_AGENT_TASKS t
 WHERE REGEXP_LIKE(t.task_name, :task_name_pattern, 'i')
 """
 
+LIST_USER_AI_AGENT_TASK_ATTRIBUTES = """
+SELECT task_name, attribute_name, attribute_value
+FROM USER_AI_AGENT_TASK_ATTRIBUTES
+WHERE REGEXP_LIKE(task_name, :task_name_pattern, 'i')
+"""
+
 GET_USER_AI_AGENT_TOOL = """
 SELECT t.tool_name, t.description
 FROM USER_AI_AGENT_TOOLS t
@@ -60,6 +72,12 @@ FROM USER_AI_AGENT_TOOLS t
 WHERE REGEXP_LIKE(t.tool_name, :tool_name_pattern, 'i')
 """
 
+LIST_USER_AI_AGENT_TOOL_ATTRIBUTES = """
+SELECT tool_name, attribute_name, attribute_value
+FROM USER_AI_AGENT_TOOL_ATTRIBUTES
+WHERE REGEXP_LIKE(tool_name, :tool_name_pattern, 'i')
+"""
+
 
 GET_USER_AI_AGENT_TEAM = """
 SELECT t.agent_team_name as team_name, t.description
@@ -80,3 +98,10 @@ SELECT t.AGENT_TEAM_NAME as team_name, description
 FROM USER_AI_AGENT_TEAMS t
 WHERE REGEXP_LIKE(t.AGENT_TEAM_NAME, :team_name_pattern, 'i')
 """
+
+
+LIST_USER_AI_AGENT_TEAM_ATTRIBUTES = """
+SELECT agent_team_name as team_name, attribute_name, attribute_value
+FROM USER_AI_AGENT_TEAM_ATTRIBUTES
+WHERE REGEXP_LIKE(agent_team_name, :team_name_pattern, 'i')
+"""
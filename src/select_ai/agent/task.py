@@ -26,6 +26,7 @@ from select_ai._enums import StrEnum
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TASK,
     GET_USER_AI_AGENT_TASK_ATTRIBUTES,
+    LIST_USER_AI_AGENT_TASK_ATTRIBUTES,
     LIST_USER_AI_AGENT_TASKS,
 )
 from select_ai.async_profile import AsyncProfile
@@ -234,6 +235,17 @@ class Task(BaseTask):
         :return: Iterator[Task]
         """
         with cursor() as cr:
+            # Fetch attributes of all matching tasks in a single query
+            # instead of one query per task
+            cr.execute(
+                LIST_USER_AI_AGENT_TASK_ATTRIBUTES,
+                task_name_pattern=task_name_pattern,
+            )
+            tasks_attributes = {}
+            for task_name, k, v in cr.fetchall():
+                if isinstance(v, oracledb.LOB):
+                    v = v.read()
+                tasks_attributes.setdefault(task_name, {})[k] = v
             cr.execute(
                 LIST_USER_AI_AGENT_TASKS,
                 task_name_pattern=task_name_pattern,
@@ -244,7 +256,11 @@ class Task(BaseTask):
                     description = row[1].read()  # Oracle.LOB
                 else:
                     description = None
-                attributes = cls._get_attributes(task_name=task_name)
+                if task_name in tasks_attributes:
+                    attributes = TaskAttributes(**tasks_attributes[task_name])
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = cls._get_attributes(task_name=task_name)
                 yield cls(
                     task_name=task_name,
                     description=description,
@@ -465,6 +481,17 @@ class AsyncTask(BaseTask):
         :return: AsyncGenerator[Task]
         """
         async with async_cursor() as cr:
+            # Fetch attributes of all matching tasks in a single query
+            # instead of one query per task
+            await cr.execute(
+                LIST_USER_AI_AGENT_TASK_ATTRIBUTES,
+                task_name_pattern=task_name_pattern,
+            )
+            tasks_attributes = {}
+            for task_name, k, v in await cr.fetchall():
+                if isinstance(v, oracledb.AsyncLOB):
+                    v = await v.read()
+                tasks_attributes.setdefault(task_name, {})[k] = v
             await cr.execute(
                 LIST_USER_AI_AGENT_TASKS,
                 task_name_pattern=task_name_pattern,
@@ -476,7 +503,11 @@ class AsyncTask(BaseTask):
                     description = await row[1].read()  # Oracle.AsyncLOB
                 else:
                     description = None
-                attributes = await cls._get_attributes(task_name=task_name)
+                if task_name in tasks_attributes:
+                    attributes = TaskAttributes(**tasks_attributes[task_name])
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = await cls._get_attributes(task_name=task_name)
                 yield cls(
                     task_name=task_name,
                     description=description,
@@ -26,6 +26,7 @@ from select_ai._enums import StrEnum
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TEAM,
     GET_USER_AI_AGENT_TEAM_ATTRIBUTES,
+    LIST_USER_AI_AGENT_TEAM_ATTRIBUTES,
     LIST_USER_AI_AGENT_TEAMS,
 )
 from select_ai.async_profile import AsyncProfile
@@ -249,6 +250,17 @@ class Team(BaseTeam):
 
         """
         with cursor() as cr:
+            # Fetch attributes of all matching teams in a single query
+            # instead of one query per team
+            cr.execute(
+                LIST_USER_AI_AGENT_TEAM_ATTRIBUTES,
+                team_name_pattern=team_name_pattern,
+            )
+            teams_attributes = {}
+            for team_name, k, v in cr.fetchall():
+                if isinstance(v, oracledb.LOB):
+                    v = v.read()
+                teams_attributes.setdefault(team_name, {})[k] = v
             cr.execute(
                 LIST_USER_AI_AGENT_TEAMS,
                 team_name_pattern=team_name_pattern,
@@ -259,7 +271,11 @@ class Team(BaseTeam):
                     description = row[1].read()  # Oracle.LOB
                 else:
                     description = None
-                attributes = cls._get_attributes(team_name=team_name)
+                if team_name in teams_attributes:
+                    attributes = TeamAttributes(**teams_attributes[team_name])
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = cls._get_attributes(team_name=team_name)
                 yield cls(
                     team_name=team_name,
                     description=description,
@@ -517,6 +533,17 @@ class AsyncTeam(BaseTeam):
 
         """
         async with async_cursor() as cr:
+            # Fetch attributes of all matching teams in a single query
+            # instead of one query per team
+            await cr.execute(
+                LIST_USER_AI_AGENT_TEAM_ATTRIBUTES,
+                team_name_pattern=team_name_pattern,
+            )
+            teams_attributes = {}
+            for team_name, k, v in await cr.fetchall():
+                if isinstance(v, oracledb.AsyncLOB):
+                    v = await v.read()
+                teams_attributes.setdefault(team_name, {})[k] = v
             await cr.execute(
                 LIST_USER_AI_AGENT_TEAMS,
                 team_name_pattern=team_name_pattern,
@@ -528,7 +555,11 @@ class AsyncTeam(BaseTeam):
                     description = await row[1].read()  # Oracle.AsyncLOB
                 else:
                     description = None
-                attributes = await cls._get_attributes(team_name=team_name)
+                if team_name in teams_attributes:
+                    attributes = TeamAttributes(**teams_attributes[team_name])
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = await cls._get_attributes(team_name=team_name)
                 yield cls(
                     team_name=team_name,
                     description=description,
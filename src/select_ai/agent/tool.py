@@ -26,6 +26,7 @@ from select_ai._enums import StrEnum
 from select_ai.agent.sql import (
     GET_USER_AI_AGENT_TOOL,
     GET_USER_AI_AGENT_TOOL_ATTRIBUTES,
+    LIST_USER_AI_AGENT_TOOL_ATTRIBUTES,
     LIST_USER_AI_AGENT_TOOLS,
 )
 from select_ai.async_profile import AsyncProfile
@@ -661,6 +662,17 @@ class Tool(_BaseTool):
         :return: Iterator[Tool]
         """
         with cursor() as cr:
+            # Fetch attributes of all matching tools in a single query
+            # instead of one query per tool
+            cr.execute(
+                LIST_USER_AI_AGENT_TOOL_ATTRIBUTES,
+                tool_name_pattern=tool_name_pattern,
+            )
+            tools_attributes = {}
+            for tool_name, k, v in cr.fetchall():
+                if isinstance(v, oracledb.LOB):
+                    v = v.read()
+                tools_attributes.setdefault(tool_name, {})[k] = v
             cr.execute(
                 LIST_USER_AI_AGENT_TOOLS,
                 tool_name_pattern=tool_name_pattern,
@@ -671,7 +683,13 @@ class Tool(_BaseTool):
                     description = row[1].read()  # Oracle.LOB
                 else:
                     description = None
-                attributes = cls._get_attributes(tool_name=tool_name)
+                if tool_name in tools_attributes:
+                    attributes = ToolAttributes.create(
+                        **tools_attributes[tool_name]
+                    )
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = cls._get_attributes(tool_name=tool_name)
                 yield cls(
                     tool_name=tool_name,
                     description=description,
@@ -1108,6 +1126,17 @@ class AsyncTool(_BaseTool):
         :return: Iterator[Tool]
         """
         async with async_cursor() as cr:
+            # Fetch attributes of all matching tools in a single query
+            # instead of one query per tool
+            await cr.execute(
+                LIST_USER_AI_AGENT_TOOL_ATTRIBUTES,
+                tool_name_pattern=tool_name_pattern,
+            )
+            tools_attributes = {}
+            for tool_name, k, v in await cr.fetchall():
+                if isinstance(v, oracledb.AsyncLOB):
+                    v = await v.read()
+                tools_attributes.setdefault(tool_name, {})[k] = v
             await cr.execute(
                 LIST_USER_AI_AGENT_TOOLS,
                 tool_name_pattern=tool_name_pattern,
@@ -1119,7 +1148,13 @@ class AsyncTool(_BaseTool):
                     description = await row[1].read()  # Oracle.AsyncLOB
                 else:
                     description = None
-                attributes = await cls._get_attributes(tool_name=tool_name)
+                if tool_name in tools_attributes:
+                    attributes = ToolAttributes.create(
+                        **tools_attributes[tool_name]
+                    )
+                else:
+                    # Created after the attributes were prefetched
+                    attributes = await cls._get_attributes(tool_name=tool_name)
                 yield cls(
                     tool_name=tool_name,
                     description=description,
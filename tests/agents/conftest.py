@@ -5,11 +5,15 @@
 # http://oss.oracle.com/licenses/upl.
 # -----------------------------------------------------------------------------
 
+import uuid
+
 import pytest
 import select_ai
 
+PYSAI_AGENT_PROFILE_NAME = f"PYSAI_AGENT_PROFILE_{uuid.uuid4().hex.upper()}"
+
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def provider():
     return select_ai.OCIGenAIProvider(
         region="us-chicago-1",
@@ -18,7 +22,7 @@ def provider():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def profile_attributes(provider, oci_credential):
     return select_ai.ProfileAttributes(
         credential_name=oci_credential["credential_name"],
@@ -27,7 +31,7 @@ def profile_attributes(provider, oci_credential):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def rag_profile_attributes(provider, oci_credential):
     return select_ai.ProfileAttributes(
         credential_name=oci_credential["credential_name"],
@@ -35,9 +39,21 @@ def rag_profile_attributes(provider, oci_credential):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def vector_index_attributes(provider, oci_credential):
     return select_ai.OracleVectorIndexAttributes(
         object_storage_credential_name=oci_credential["credential_name"],
         location="https://objectstorage.us-ashburn-1.oraclecloud.com/n/dwcsdev/b/conda-environment/o/tenant1-pdb3/graph",
     )
+
+
+@pytest.fixture(scope="session")
+def python_gen_ai_profile(profile_attributes):
+    """AI profile shared by the agent test modules"""
+    profile = select_ai.Profile(
+        profile_name=PYSAI_AGENT_PROFILE_NAME,
+        description="OCI GENAI Profile",
+        attributes=profile_attributes,
+    )
+    yield profile
+    profile.delete(force=True)
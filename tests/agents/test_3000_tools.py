@@ -15,35 +15,31 @@ import pytest
 import select_ai
 from select_ai.agent import Tool
 
-PYSAI_3000_PROFILE_NAME = f"PYSAI_3000_{uuid.uuid4().hex.upper()}"
-PYSAI_3000_SQL_TOOL_NAME = f"PYSAI_3000_SQL_TOOL_{uuid.uuid4().hex.upper()}"
+PYSAI_3000_UUID = uuid.uuid4().hex.upper()
+
+PYSAI_3000_SQL_TOOL_NAME = f"PYSAI_3000_SQL_TOOL_{PYSAI_3000_UUID}"
 PYSAI_3000_SQL_TOOL_DESCRIPTION = f"SQL Tool for Python 3000"
 
-PYSAI_3000_RAG_PROFILE_NAME = f"PYSAI_3000_RAG_{uuid.uuid4().hex.upper()}"
-PYSAI_3000_RAG_VECTOR_INDEX_NAME = (
-    f"PYSAI_3000_RAG_VECTOR_{uuid.uuid4().hex.upper()}"
-)
-PYSAI_3000_RAG_TOOL_NAME = f"PYSAI_3000_RAG_TOOL_{uuid.uuid4().hex.upper()}"
+PYSAI_3000_RAG_PROFILE_NAME = f"PYSAI_3000_RAG_{PYSAI_3000_UUID}"
+PYSAI_3000_RAG_VECTOR_INDEX_NAME = f"PYSAI_3000_RAG_VECTOR_{PYSAI_3000_UUID}"
+PYSAI_3000_RAG_TOOL_NAME = f"PYSAI_3000_RAG_TOOL_{PYSAI_3000_UUID}"
 PYSAI_3000_RAG_TOOL_DESCRIPTION = f"RAG Tool for Python 3000"
 
-PYSAI_3000_PL_SQL_TOOL_NAME = (
-    f"PYSAI_3000_PL_SQL_TOOL_{uuid.uuid4().hex.upper()}"
-)
+PYSAI_3000_PL_SQL_TOOL_NAME = f"PYSAI_3000_PL_SQL_TOOL_{PYSAI_3000_UUID}"
 PYSAI_3000_PL_SQL_TOOL_DESCRIPTION = f"PL/SQL Tool for Python 3000"
-PYSAI_3000_PL_SQL_FUNC_NAME = (
-    f"PYSAI_3000_PL_SQL_FUNC_{uuid.uuid4().hex.upper()}"
-)
+PYSAI_3000_PL_SQL_FUNC_NAME = f"PYSAI_3000_PL_SQL_FUNC_{PYSAI_3000_UUID}"
 
+PYSAI_3000_TOOL_NAMES = (
+    PYSAI_3000_SQL_TOOL_NAME,
+    PYSAI_3000_RAG_TOOL_NAME,
+    PYSAI_3000_PL_SQL_TOOL_NAME,
+)
 
-@pytest.fixture(scope="module")
-def python_gen_ai_profile(profile_attributes):
-    profile = select_ai.Profile(
-        profile_name=PYSAI_3000_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    profile.delete(force=True)
+PYSAI_3000_GET_TOOL_STATUS = """
+SELECT status
+FROM USER_AI_AGENT_TOOLS
+WHERE tool_name = :tool_name
+"""
 
 
 @pytest.fixture(scope="module")
@@ -57,12 +53,35 @@ def python_gen_rag_ai_profile(rag_profile_attributes):
     profile.delete(force=True)
 
 
+def _check_listed_tools(tools, sql_profile_name):
+    """Checks that each test tool is listed with its own attributes"""
+    tools = {tool.tool_name: tool for tool in tools}
+    missing = set(PYSAI_3000_TOOL_NAMES) - tools.keys()
+    assert not missing
+    sql_tool_params = tools[PYSAI_3000_SQL_TOOL_NAME].attributes.tool_params
+    assert isinstance(sql_tool_params, select_ai.agent.SQLToolParams)
+    assert sql_tool_params.profile_name == sql_profile_name
+    rag_tool_params = tools[PYSAI_3000_RAG_TOOL_NAME].attributes.tool_params
+    assert isinstance(rag_tool_params, select_ai.agent.RAGToolParams)
+    assert rag_tool_params.profile_name == PYSAI_3000_RAG_PROFILE_NAME
+    pl_sql_tool = tools[PYSAI_3000_PL_SQL_TOOL_NAME]
+    assert pl_sql_tool.attributes.function == PYSAI_3000_PL_SQL_FUNC_NAME
+
+
+def get_tool_status(cursor, tool_name):
+    """Returns the status of a tool using a bind variable so the cached
+    statement is reused across calls"""
+    cursor.execute(PYSAI_3000_GET_TOOL_STATUS, tool_name=tool_name)
+    (status,) = cursor.fetchone()
+    return status
+
+
 @pytest.fixture(scope="module")
 def sql_tool(python_gen_ai_profile):
-    sql_tool = select_ai.agent.Tool.create_sql_tool(
+    sql_tool = Tool.create_sql_tool(
         tool_name=PYSAI_3000_SQL_TOOL_NAME,
         description=PYSAI_3000_SQL_TOOL_DESCRIPTION,
-        profile_name=PYSAI_3000_PROFILE_NAME,
+        profile_name=python_gen_ai_profile.profile_name,
         replace=True,
     )
     yield sql_tool
@@ -84,7 +103,7 @@ def vector_index(vector_index_attributes, python_gen_rag_ai_profile):
 
 @pytest.fixture(scope="module")
 def rag_tool(vector_index):
-    sql_tool = select_ai.agent.Tool.create_rag_tool(
+    sql_tool = Tool.create_rag_tool(
         tool_name=PYSAI_3000_RAG_TOOL_NAME,
         description=PYSAI_3000_RAG_TOOL_DESCRIPTION,
         profile_name=PYSAI_3000_RAG_PROFILE_NAME,
@@ -117,7 +136,7 @@ def pl_sql_function():
 
 @pytest.fixture(scope="module")
 def pl_sql_tool(pl_sql_function):
-    pl_sql_tool = select_ai.agent.Tool.create_pl_sql_tool(
+    pl_sql_tool = Tool.create_pl_sql_tool(
         tool_name=PYSAI_3000_PL_SQL_TOOL_NAME,
         function=PYSAI_3000_PL_SQL_FUNC_NAME,
         description=PYSAI_3000_PL_SQL_TOOL_DESCRIPTION,
@@ -126,61 +145,90 @@ def pl_sql_tool(pl_sql_function):
     pl_sql_tool.delete(force=True)
 
 
-def test_3000(sql_tool):
-    """test SQL tool creation and parameter validation"""
-    assert (
-        sql_tool.attributes.tool_params.profile_name == PYSAI_3000_PROFILE_NAME
-    )
-    assert sql_tool.tool_name == PYSAI_3000_SQL_TOOL_NAME
-    assert sql_tool.description == PYSAI_3000_SQL_TOOL_DESCRIPTION
-    assert isinstance(
-        sql_tool.attributes.tool_params, select_ai.agent.SQLToolParams
-    )
-
-
-def test_3001(rag_tool):
-    """test RAG tool creation and parameter validation"""
-    assert (
-        rag_tool.attributes.tool_params.profile_name
-        == PYSAI_3000_RAG_PROFILE_NAME
-    )
-    assert rag_tool.tool_name == PYSAI_3000_RAG_TOOL_NAME
-    assert rag_tool.description == PYSAI_3000_RAG_TOOL_DESCRIPTION
-    assert isinstance(
-        rag_tool.attributes.tool_params, select_ai.agent.RAGToolParams
-    )
+@pytest.mark.parametrize(
+    "tool_fixture, tool_name, description",
+    [
+        pytest.param(
+            "sql_tool",
+            PYSAI_3000_SQL_TOOL_NAME,
+            PYSAI_3000_SQL_TOOL_DESCRIPTION,
+            id="sql",
+        ),
+        pytest.param(
+            "rag_tool",
+            PYSAI_3000_RAG_TOOL_NAME,
+            PYSAI_3000_RAG_TOOL_DESCRIPTION,
+            id="rag",
+        ),
+        pytest.param(
+            "pl_sql_tool",
+            PYSAI_3000_PL_SQL_TOOL_NAME,
+            PYSAI_3000_PL_SQL_TOOL_DESCRIPTION,
+            id="pl_sql",
+        ),
+    ],
+)
+def test_3000(request, tool_fixture, tool_name, description):
+    """test tool creation"""
+    tool = request.getfixturevalue(tool_fixture)
+    assert tool.tool_name == tool_name
+    assert tool.description == description
+
+
+@pytest.mark.parametrize(
+    "tool_fixture, profile_fixture, tool_params_type",
+    [
+        pytest.param(
+            "sql_tool",
+            "python_gen_ai_profile",
+            select_ai.agent.SQLToolParams,
+            id="sql",
+        ),
+        pytest.param(
+            "rag_tool",
+            "python_gen_rag_ai_profile",
+            select_ai.agent.RAGToolParams,
+            id="rag",
+        ),
+    ],
+)
+def test_3001(request, tool_fixture, profile_fixture, tool_params_type):
+    """test built-in tool parameter validation"""
+    tool = request.getfixturevalue(tool_fixture)
+    profile = request.getfixturevalue(profile_fixture)
+    assert isinstance(tool.attributes.tool_params, tool_params_type)
+    assert tool.attributes.tool_params.profile_name == profile.profile_name
 
 
 def test_3002(pl_sql_tool):
-    """test PL SQL tool creation and parameter validation"""
-    assert pl_sql_tool.tool_name == PYSAI_3000_PL_SQL_TOOL_NAME
-    assert pl_sql_tool.description == PYSAI_3000_PL_SQL_TOOL_DESCRIPTION
+    """test PL SQL tool parameter validation"""
     assert pl_sql_tool.attributes.function == PYSAI_3000_PL_SQL_FUNC_NAME
 
 
-def test_3003():
+def test_3003(python_gen_ai_profile):
     """list tools"""
-    tools = list(select_ai.agent.Tool.list())
-    tool_names = set(tool.tool_name for tool in tools)
-    assert PYSAI_3000_RAG_TOOL_NAME in tool_names
-    assert PYSAI_3000_SQL_TOOL_NAME in tool_names
-    assert PYSAI_3000_PL_SQL_TOOL_NAME in tool_names
+    _check_listed_tools(Tool.list(), python_gen_ai_profile.profile_name)
 
 
-def test_3004():
+def test_3004(python_gen_ai_profile):
     """list tools matching a REGEX pattern"""
-    tools = list(select_ai.agent.Tool.list(tool_name_pattern="^PYSAI_3000"))
-    tool_names = set(tool.tool_name for tool in tools)
-    assert PYSAI_3000_RAG_TOOL_NAME in tool_names
-    assert PYSAI_3000_SQL_TOOL_NAME in tool_names
-    assert PYSAI_3000_PL_SQL_TOOL_NAME in tool_names
+    tools = Tool.list(tool_name_pattern="^PYSAI_3000")
+    _check_listed_tools(tools, python_gen_ai_profile.profile_name)
 
 
 def test_3005():
     """fetch tool"""
-    sql_tool = select_ai.agent.Tool.fetch(tool_name=PYSAI_3000_SQL_TOOL_NAME)
+    sql_tool = Tool.fetch(tool_name=PYSAI_3000_SQL_TOOL_NAME)
     assert sql_tool.tool_name == PYSAI_3000_SQL_TOOL_NAME
     assert sql_tool.description == PYSAI_3000_SQL_TOOL_DESCRIPTION
     assert isinstance(
         sql_tool.attributes.tool_params, select_ai.agent.SQLToolParams
     )
+
+
+def test_3006(cursor, sql_tool):
+    """disable and enable tool"""
+    sql_tool.disable()
+    assert get_tool_status(cursor, sql_tool.tool_name) == "DISABLED"
+    sql_tool.enable()
+    assert get_tool_status(cursor, sql_tool.tool_name) == "ENABLED"
@@ -50,16 +50,17 @@ def test_3100(task, task_attributes):
 
 
 @pytest.mark.parametrize("task_name_pattern", [None, "^PYSAI_3100_"])
-def test_3101(task_name_pattern):
+def test_3101(task_attributes, task_name_pattern):
     """task list"""
     if task_name_pattern:
         tasks = list(select_ai.agent.Task.list(task_name_pattern))
     else:
         tasks = list(select_ai.agent.Task.list())
-    task_names = set(task.task_name for task in tasks)
-    task_descriptions = set(task.description for task in tasks)
-    assert PYSAI_3100_TASK_NAME in task_names
-    assert PYSAI_3100_SQL_TASK_DESCRIPTION in task_descriptions
+    tasks = {task.task_name: task for task in tasks}
+    assert PYSAI_3100_TASK_NAME in tasks
+    listed_task = tasks[PYSAI_3100_TASK_NAME]
+    assert listed_task.description == PYSAI_3100_SQL_TASK_DESCRIPTION
+    assert listed_task.attributes == task_attributes
 
 
 def test_3102(task_attributes):
@@ -16,24 +16,12 @@ from select_ai.agent import Agent, AgentAttributes
 
 PYSAI_3200_AGENT_NAME = f"PYSAI_3200_AGENT_{uuid.uuid4().hex.upper()}"
 PYSAI_3200_AGENT_DESCRIPTION = "PYSAI_3200_AGENT_DESCRIPTION"
-PYSAI_3200_PROFILE_NAME = f"PYSAI_3200_PROFILE_{uuid.uuid4().hex.upper()}"
 
 
 @pytest.fixture(scope="module")
-def python_gen_ai_profile(profile_attributes):
-    profile = select_ai.Profile(
-        profile_name=PYSAI_3200_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    profile.delete(force=True)
-
-
-@pytest.fixture(scope="module")
-def agent_attributes():
+def agent_attributes(python_gen_ai_profile):
     agent_attributes = AgentAttributes(
-        profile_name=PYSAI_3200_PROFILE_NAME,
+        profile_name=python_gen_ai_profile.profile_name,
         role="You are an AI Movie Analyst."
         "You can help answer a variety of questions related to movies.",
         enable_human_tool=False,
@@ -42,7 +30,7 @@ def agent_attributes():
 
 
 @pytest.fixture(scope="module")
-def agent(python_gen_ai_profile, agent_attributes):
+def agent(agent_attributes):
     agent = Agent(
         agent_name=PYSAI_3200_AGENT_NAME,
         attributes=agent_attributes,
@@ -60,15 +48,16 @@ def test_3200(agent, agent_attributes):
 
 
 @pytest.mark.parametrize("agent_name_pattern", [None, "^PYSAI_3200_AGENT_"])
-def test_3201(agent_name_pattern):
+def test_3201(agent_attributes, agent_name_pattern):
     if agent_name_pattern:
         agents = list(select_ai.agent.Agent.list(agent_name_pattern))
     else:
         agents = list(select_ai.agent.Agent.list())
-    agent_names = set(agent.agent_name for agent in agents)
-    agent_descriptions = set(agent.description for agent in agents)
-    assert PYSAI_3200_AGENT_NAME in agent_names
-    assert PYSAI_3200_AGENT_DESCRIPTION in agent_descriptions
+    agents = {agent.agent_name: agent for agent in agents}
+    assert PYSAI_3200_AGENT_NAME in agents
+    listed_agent = agents[PYSAI_3200_AGENT_NAME]
+    assert listed_agent.description == PYSAI_3200_AGENT_DESCRIPTION
+    assert listed_agent.attributes == agent_attributes
 
 
 def test_3203(agent_attributes):
@@ -12,7 +12,6 @@
 import uuid
 
 import pytest
-import select_ai
 from select_ai.agent import (
     Agent,
     AgentAttributes,
@@ -22,26 +21,15 @@ from select_ai.agent import (
     TeamAttributes,
 )
 
-PYSAI_3300_AGENT_NAME = f"PYSAI_3300_AGENT_{uuid.uuid4().hex.upper()}"
+PYSAI_3300_UUID = uuid.uuid4().hex.upper()
+PYSAI_3300_AGENT_NAME = f"PYSAI_3300_AGENT_{PYSAI_3300_UUID}"
 PYSAI_3300_AGENT_DESCRIPTION = "PYSAI_3300_AGENT_DESCRIPTION"
-PYSAI_3300_PROFILE_NAME = f"PYSAI_3300_PROFILE_{uuid.uuid4().hex.upper()}"
-PYSAI_3300_TASK_NAME = f"PYSAI_3300_{uuid.uuid4().hex.upper()}"
+PYSAI_3300_TASK_NAME = f"PYSAI_3300_{PYSAI_3300_UUID}"
 PYSAI_3300_TASK_DESCRIPTION = "PYSAI_3100_SQL_TASK_DESCRIPTION"
-PYSAI_3300_TEAM_NAME = f"PYSAI_3300_TEAM_{uuid.uuid4().hex.upper()}"
+PYSAI_3300_TEAM_NAME = f"PYSAI_3300_TEAM_{PYSAI_3300_UUID}"
 PYSAI_3300_TEAM_DESCRIPTION = "PYSAI_3300_TEAM_DESCRIPTION"
 
 
-@pytest.fixture(scope="module")
-def python_gen_ai_profile(profile_attributes):
-    profile = select_ai.Profile(
-        profile_name=PYSAI_3300_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    profile.delete(force=True)
-
-
 @pytest.fixture(scope="module")
 def task_attributes():
     return TaskAttributes(
@@ -69,7 +57,7 @@ def agent(python_gen_ai_profile):
         agent_name=PYSAI_3300_AGENT_NAME,
         description=PYSAI_3300_AGENT_DESCRIPTION,
         attributes=AgentAttributes(
-            profile_name=PYSAI_3300_PROFILE_NAME,
+            profile_name=python_gen_ai_profile.profile_name,
             role="You are an AI Movie Analyst. "
             "Your can help answer a variety of questions related to movies. ",
             enable_human_tool=False,
@@ -107,15 +95,16 @@ def test_3300(team, team_attributes):
 
 
 @pytest.mark.parametrize("team_name_pattern", [None, "^PYSAI_3300_TEAM_"])
-def test_3301(team_name_pattern):
+def test_3301(team_attributes, team_name_pattern):
     if team_name_pattern:
         teams = list(Team.list(team_name_pattern))
     else:
         teams = list(Team.list())
-    team_names = set(team.team_name for team in teams)
-    team_descriptions = set(team.description for team in teams)
-    assert PYSAI_3300_TEAM_NAME in team_names
-    assert PYSAI_3300_TEAM_DESCRIPTION in team_descriptions
+    teams = {team.team_name: team for team in teams}
+    assert PYSAI_3300_TEAM_NAME in teams
+    listed_team = teams[PYSAI_3300_TEAM_NAME]
+    assert listed_team.description == PYSAI_3300_TEAM_DESCRIPTION
+    assert listed_team.attributes == team_attributes
 
 
 def test_3302(team_attributes):
@@ -15,35 +15,40 @@ import pytest
 import select_ai
 from select_ai.agent import AsyncTool
 
-PYSAI_3400_PROFILE_NAME = f"PYSAI_3400_{uuid.uuid4().hex.upper()}"
-PYSAI_3400_SQL_TOOL_NAME = f"PYSAI_3400_SQL_TOOL_{uuid.uuid4().hex.upper()}"
+PYSAI_3400_UUID = uuid.uuid4().hex.upper()
+
+PYSAI_3400_SQL_TOOL_NAME = f"PYSAI_3400_SQL_TOOL_{PYSAI_3400_UUID}"
 PYSAI_3400_SQL_TOOL_DESCRIPTION = f"SQL Tool for Python 3000"
 
-PYSAI_3400_RAG_PROFILE_NAME = f"PYSAI_3400_RAG_{uuid.uuid4().hex.upper()}"
-PYSAI_3400_RAG_VECTOR_INDEX_NAME = (
-    f"PYSAI_3400_RAG_VECTOR_{uuid.uuid4().hex.upper()}"
-)
-PYSAI_3400_RAG_TOOL_NAME = f"PYSAI_3400_RAG_TOOL_{uuid.uuid4().hex.upper()}"
+PYSAI_3400_RAG_PROFILE_NAME = f"PYSAI_3400_RAG_{PYSAI_3400_UUID}"
+PYSAI_3400_RAG_VECTOR_INDEX_NAME = f"PYSAI_3400_RAG_VECTOR_{PYSAI_3400_UUID}"
+PYSAI_3400_RAG_TOOL_NAME = f"PYSAI_3400_RAG_TOOL_{PYSAI_3400_UUID}"
 PYSAI_3400_RAG_TOOL_DESCRIPTION = f"RAG Tool for Python 3000"
 
-PYSAI_3400_PL_SQL_TOOL_NAME = (
-    f"PYSAI_3400_PL_SQL_TOOL_{uuid.uuid4().hex.upper()}"
-)
+PYSAI_3400_PL_SQL_TOOL_NAME = f"PYSAI_3400_PL_SQL_TOOL_{PYSAI_3400_UUID}"
 PYSAI_3400_PL_SQL_TOOL_DESCRIPTION = f"PL/SQL Tool for Python 3000"
-PYSAI_3400_PL_SQL_FUNC_NAME = (
-    f"PYSAI_3400_PL_SQL_FUNC_{uuid.uuid4().hex.upper()}"
+PYSAI_3400_PL_SQL_FUNC_NAME = f"PYSAI_3400_PL_SQL_FUNC_{PYSAI_3400_UUID}"
+
+PYSAI_3400_TOOL_NAMES = (
+    PYSAI_3400_SQL_TOOL_NAME,
+    PYSAI_3400_RAG_TOOL_NAME,
+    PYSAI_3400_PL_SQL_TOOL_NAME,
 )
 
 
-@pytest.fixture(scope="module")
-async def python_gen_ai_profile(profile_attributes):
-    profile = await select_ai.AsyncProfile(
-        profile_name=PYSAI_3400_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    await profile.delete(force=True)
+def _check_listed_tools(tools, sql_profile_name):
+    """Checks that each test tool is listed with its own attributes"""
+    tools = {tool.tool_name: tool for tool in tools}
+    missing = set(PYSAI_3400_TOOL_NAMES) - tools.keys()
+    assert not missing
+    sql_tool_params = tools[PYSAI_3400_SQL_TOOL_NAME].attributes.tool_params
+    assert isinstance(sql_tool_params, select_ai.agent.SQLToolParams)
+    assert sql_tool_params.profile_name == sql_profile_name
+    rag_tool_params = tools[PYSAI_3400_RAG_TOOL_NAME].attributes.tool_params
+    assert isinstance(rag_tool_params, select_ai.agent.RAGToolParams)
+    assert rag_tool_params.profile_name == PYSAI_3400_RAG_PROFILE_NAME
+    pl_sql_tool = tools[PYSAI_3400_PL_SQL_TOOL_NAME]
+    assert pl_sql_tool.attributes.function == PYSAI_3400_PL_SQL_FUNC_NAME
 
 
 @pytest.fixture(scope="module")
@@ -62,7 +67,7 @@ async def sql_tool(python_gen_ai_profile):
     sql_tool = await AsyncTool.create_sql_tool(
         tool_name=PYSAI_3400_SQL_TOOL_NAME,
         description=PYSAI_3400_SQL_TOOL_DESCRIPTION,
-        profile_name=PYSAI_3400_PROFILE_NAME,
+        profile_name=python_gen_ai_profile.profile_name,
         replace=True,
     )
     yield sql_tool
@@ -126,10 +131,11 @@ async def pl_sql_tool(pl_sql_function):
     await pl_sql_tool.delete(force=True)
 
 
-def test_3400(sql_tool):
+def test_3400(sql_tool, python_gen_ai_profile):
     """test SQL tool creation and parameter validation"""
     assert (
-        sql_tool.attributes.tool_params.profile_name == PYSAI_3400_PROFILE_NAME
+        sql_tool.attributes.tool_params.profile_name
+        == python_gen_ai_profile.profile_name
     )
     assert sql_tool.tool_name == PYSAI_3400_SQL_TOOL_NAME
     assert sql_tool.description == PYSAI_3400_SQL_TOOL_DESCRIPTION
@@ -158,24 +164,18 @@ def test_3402(pl_sql_tool):
     assert pl_sql_tool.attributes.function == PYSAI_3400_PL_SQL_FUNC_NAME
 
 
-async def test_3403():
+async def test_3403(python_gen_ai_profile):
     """list tools"""
     tools = [tool async for tool in AsyncTool.list()]
-    tool_names = set(tool.tool_name for tool in tools)
-    assert PYSAI_3400_RAG_TOOL_NAME in tool_names
-    assert PYSAI_3400_SQL_TOOL_NAME in tool_names
-    assert PYSAI_3400_PL_SQL_TOOL_NAME in tool_names
+    _check_listed_tools(tools, python_gen_ai_profile.profile_name)
 
 
-async def test_3404():
+async def test_3404(python_gen_ai_profile):
     """list tools matching a REGEX pattern"""
     tools = [
         tool async for tool in AsyncTool.list(tool_name_pattern="^PYSAI_3400")
     ]
-    tool_names = set(tool.tool_name for tool in tools)
-    assert PYSAI_3400_RAG_TOOL_NAME in tool_names
-    assert PYSAI_3400_SQL_TOOL_NAME in tool_names
-    assert PYSAI_3400_PL_SQL_TOOL_NAME in tool_names
+    _check_listed_tools(tools, python_gen_ai_profile.profile_name)
 
 
 async def test_3405():
@@ -50,7 +50,7 @@ async def test_3500(task, task_attributes):
 
 
 @pytest.mark.parametrize("task_name_pattern", [None, "^PYSAI_3500_"])
-async def test_3501(task_name_pattern):
+async def test_3501(task_attributes, task_name_pattern):
     """task list"""
     if task_name_pattern:
         tasks = [
@@ -59,10 +59,11 @@ async def test_3501(task_name_pattern):
         ]
     else:
         tasks = [task async for task in select_ai.agent.AsyncTask.list()]
-    task_names = set(task.task_name for task in tasks)
-    task_descriptions = set(task.description for task in tasks)
-    assert PYSAI_3500_TASK_NAME in task_names
-    assert PYSAI_3500_SQL_TASK_DESCRIPTION in task_descriptions
+    tasks = {task.task_name: task for task in tasks}
+    assert PYSAI_3500_TASK_NAME in tasks
+    listed_task = tasks[PYSAI_3500_TASK_NAME]
+    assert listed_task.description == PYSAI_3500_SQL_TASK_DESCRIPTION
+    assert listed_task.attributes == task_attributes
 
 
 async def test_3502(task_attributes):
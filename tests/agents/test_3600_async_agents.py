@@ -15,26 +15,15 @@ import pytest
 import select_ai
 from select_ai.agent import AgentAttributes, AsyncAgent
 
-PYSAI_3600_AGENT_NAME = f"PYSAI_3600_AGENT_{uuid.uuid4().hex.upper()}"
+PYSAI_3600_UUID = uuid.uuid4().hex.upper()
+PYSAI_3600_AGENT_NAME = f"PYSAI_3600_AGENT_{PYSAI_3600_UUID}"
 PYSAI_3600_AGENT_DESCRIPTION = "PYSAI_3600_AGENT_DESCRIPTION"
-PYSAI_3600_PROFILE_NAME = f"PYSAI_3600_PROFILE_{uuid.uuid4().hex.upper()}"
 
 
 @pytest.fixture(scope="module")
-async def async_python_gen_ai_profile(profile_attributes):
-    profile = await select_ai.AsyncProfile(
-        profile_name=PYSAI_3600_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    await profile.delete(force=True)
-
-
-@pytest.fixture(scope="module")
-def agent_attributes():
+def agent_attributes(python_gen_ai_profile):
     agent_attributes = AgentAttributes(
-        profile_name=PYSAI_3600_PROFILE_NAME,
+        profile_name=python_gen_ai_profile.profile_name,
         role="You are an AI Movie Analyst."
         "Your can help answer a variety of questions related to movies.",
         enable_human_tool=False,
@@ -43,7 +32,7 @@ def agent_attributes():
 
 
 @pytest.fixture(scope="module")
-async def agent(async_python_gen_ai_profile, agent_attributes):
+async def agent(agent_attributes):
     agent = AsyncAgent(
         agent_name=PYSAI_3600_AGENT_NAME,
         attributes=agent_attributes,
@@ -61,7 +50,7 @@ async def test_3200(agent, agent_attributes):
 
 
 @pytest.mark.parametrize("agent_name_pattern", [None, "^PYSAI_3600_AGENT_"])
-async def test_3201(agent_name_pattern):
+async def test_3201(agent_attributes, agent_name_pattern):
     if agent_name_pattern:
         agents = [
             agent
@@ -71,10 +60,11 @@ async def test_3201(agent_name_pattern):
         ]
     else:
         agents = [agent async for agent in select_ai.agent.AsyncAgent.list()]
-    agent_names = set(agent.agent_name for agent in agents)
-    agent_descriptions = set(agent.description for agent in agents)
-    assert PYSAI_3600_AGENT_NAME in agent_names
-    assert PYSAI_3600_AGENT_DESCRIPTION in agent_descriptions
+    agents = {agent.agent_name: agent for agent in agents}
+    assert PYSAI_3600_AGENT_NAME in agents
+    listed_agent = agents[PYSAI_3600_AGENT_NAME]
+    assert listed_agent.description == PYSAI_3600_AGENT_DESCRIPTION
+    assert listed_agent.attributes == agent_attributes
 
 
 async def test_3203(agent_attributes):
@@ -22,26 +22,15 @@ from select_ai.agent import (
     TeamAttributes,
 )
 
-PYSAI_3700_AGENT_NAME = f"PYSAI_3700_AGENT_{uuid.uuid4().hex.upper()}"
+PYSAI_3700_UUID = uuid.uuid4().hex.upper()
+PYSAI_3700_AGENT_NAME = f"PYSAI_3700_AGENT_{PYSAI_3700_UUID}"
 PYSAI_3700_AGENT_DESCRIPTION = "PYSAI_3700_AGENT_DESCRIPTION"
-PYSAI_3700_PROFILE_NAME = f"PYSAI_3700_PROFILE_{uuid.uuid4().hex.upper()}"
-PYSAI_3700_TASK_NAME = f"PYSAI_3700_{uuid.uuid4().hex.upper()}"
+PYSAI_3700_TASK_NAME = f"PYSAI_3700_{PYSAI_3700_UUID}"
 PYSAI_3700_TASK_DESCRIPTION = "PYSAI_3100_SQL_TASK_DESCRIPTION"
-PYSAI_3700_TEAM_NAME = f"PYSAI_3700_TEAM_{uuid.uuid4().hex.upper()}"
+PYSAI_3700_TEAM_NAME = f"PYSAI_3700_TEAM_{PYSAI_3700_UUID}"
 PYSAI_3700_TEAM_DESCRIPTION = "PYSAI_3700_TEAM_DESCRIPTION"
 
 
-@pytest.fixture(scope="module")
-async def python_gen_ai_profile(profile_attributes):
-    profile = await select_ai.AsyncProfile(
-        profile_name=PYSAI_3700_PROFILE_NAME,
-        description="OCI GENAI Profile",
-        attributes=profile_attributes,
-    )
-    yield profile
-    await profile.delete(force=True)
-
-
 @pytest.fixture(scope="module")
 def task_attributes():
     return TaskAttributes(
@@ -69,7 +58,7 @@ async def agent(python_gen_ai_profile):
         agent_name=PYSAI_3700_AGENT_NAME,
         description=PYSAI_3700_AGENT_DESCRIPTION,
         attributes=AgentAttributes(
-            profile_name=PYSAI_3700_PROFILE_NAME,
+            profile_name=python_gen_ai_profile.profile_name,
             role="You are an AI Movie Analyst. "
             "Your can help answer a variety of questions related to movies. ",
             enable_human_tool=False,
@@ -107,15 +96,16 @@ def test_3300(team, team_attributes):
 
 
 @pytest.mark.parametrize("team_name_pattern", [None, "^PYSAI_3700_TEAM_"])
-async def test_3301(team_name_pattern):
+async def test_3301(team_attributes, team_name_pattern):
     if team_name_pattern:
         teams = [team async for team in AsyncTeam.list(team_name_pattern)]
     else:
         teams = [team async for team in select_ai.agent.AsyncTeam.list()]
-    team_names = set(team.team_name for team in teams)
-    team_descriptions = set(team.description for team in teams)
-    assert PYSAI_3700_TEAM_NAME in team_names
-    assert PYSAI_3700_TEAM_DESCRIPTION in team_descriptions
+    teams = {team.team_name: team for team in teams}
+    assert PYSAI_3700_TEAM_NAME in teams
+    listed_team = teams[PYSAI_3700_TEAM_NAME]
+    assert listed_team.description == PYSAI_3700_TEAM_DESCRIPTION
+    assert listed_team.attributes == team_attributes
 
 
 async def test_3302(team_attributes):
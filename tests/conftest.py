@@ -24,15 +24,37 @@
 #
 #           OpenAI
 #   PYSAI_TEST_OPENAI_API_KEY
+#
+#  Test object names carry a UUID, so the suite can run in parallel with
+#  pytest-xdist. Distribute by file to keep module scoped fixtures on a
+#  single worker:
+#
+#   pytest -n auto --dist=loadfile
+#
+#  Parallel runs have not been validated against a real database yet. Every
+#  worker runs setup_test_user, so the user creation, the grants and the
+#  network ACL appends of grant_http_access() are issued concurrently, and
+#  only the ORA-01920 race on CREATE USER is handled.
+#
+#  The required variables above must be set first: a missing one makes
+#  get_env_value() call pytest.exit(), which xdist reports as a worker
+#  crash (INTERNALERROR) rather than the plain message
 
+import functools
+import logging
+import logging.handlers
 import os
+import queue
 import uuid
+from pathlib import Path
 
+import oracledb
 import pytest
 import select_ai
 
 PYSAI_TEST_USER = "PYSAI_TEST_USER"
 PYSAI_OCI_CREDENTIAL_NAME = f"PYSAI_OCI_CREDENTIAL_{uuid.uuid4().hex.upper()}"
+LOG_FORMAT = "%(levelname)s: [%(name)s] %(message)s"
 _BASIC_SCHEMA_PRIVILEGES = (
     "CREATE SESSION",
     "CREATE TABLE",
@@ -50,9 +72,16 @@ def _ensure_test_user_exists(username: str, password: str):
         if cr.fetchone():
             return
         escaped_password = password.replace('"', '""')
-        cr.execute(
-            f'CREATE USER {username_upper} IDENTIFIED BY "{escaped_password}"'
-        )
+        try:
+            cr.execute(
+                f"CREATE USER {username_upper} "
+                f'IDENTIFIED BY "{escaped_password}"'
+            )
+        except oracledb.DatabaseError as err:
+            (err_obj,) = err.args
+            # ORA-01920: user was created by a concurrent pytest-xdist worker
+            if err_obj.code != 1920:
+                raise
     select_ai.db.get_connection().commit()
 
 
@@ -188,3 +217,86 @@ def oci_credential(connect, test_env):
 @pytest.fixture(scope="module")
 def oci_compartment_id(test_env):
     return get_env_value("OCI_COMPARTMENT_ID", required=True)
+
+
+@functools.cache
+def _log_dir() -> Path:
+    """Resolves and creates the log directory once per session"""
+    log_dir = Path(__file__).resolve().parents[1] / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def _configure_logger(
+    logger: logging.Logger, module_file: str
+) -> logging.handlers.QueueListener:
+    logger.setLevel(logging.DEBUG)
+    log_name = f"tkex_{Path(module_file).stem}"
+    # pytest-xdist workers may run tests of the same module, give each
+    # worker its own file so they don't truncate each other's logs
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id:
+        log_name = f"{log_name}_{worker_id}"
+    log_file = _log_dir() / f"{log_name}.log"
+
+    formatter = logging.Formatter(fmt=LOG_FORMAT)
+
+    file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    # Buffer records in memory and write them out in batches; anything at
+    # ERROR or above is written straight away
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(formatter)
+
+    # QueueHandler still formats the message in the calling thread before
+    # enqueueing it; the listener thread only moves the file/console I/O
+    # off the test thread
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        buffered_file_handler,
+        console_handler,
+        respect_handler_level=True,
+    )
+
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    logger.info("Configured logging for module")
+    return listener
+
+
+@pytest.fixture(scope="module", autouse=True)
+def configure_module_logging(request):
+    module = request.module
+    logger = logging.getLogger(module.__name__)
+    listener = _configure_logger(logger, module.__file__)
+    yield
+    listener.stop()
+    for handler in listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.handlers.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    # A hook instead of an autouse fixture, so per-test logging does not
+    # add a fixture to every test's setup and teardown
+    logger = logging.getLogger(item.module.__name__)
+    logger.info("Starting test %s", item.name)
+    yield
+    logger.info("Finished test %s", item.name)
@@ -62,7 +62,7 @@ def synthetic_profile_attributes(oci_credential, synthetic_provider):
 
 @pytest.fixture(scope="module")
 def synthetic_profile(synthetic_profile_attributes):
-    logger.info("Creating synthetic profile %s", f"{PROFILE_PREFIX}_SYNC")
+    logger.info("Creating synthetic profile %s_SYNC", PROFILE_PREFIX)
     profile = Profile(
         profile_name=f"{PROFILE_PREFIX}_SYNC",
         attributes=synthetic_profile_attributes,
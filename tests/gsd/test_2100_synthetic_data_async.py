@@ -64,9 +64,7 @@ def async_synthetic_profile_attributes(
 
 @pytest.fixture(scope="module")
 async def async_synthetic_profile(async_synthetic_profile_attributes):
-    logger.info(
-        "Creating async synthetic profile %s", f"{PROFILE_PREFIX}_ASYNC"
-    )
+    logger.info("Creating async synthetic profile %s_ASYNC", PROFILE_PREFIX)
     profile = await AsyncProfile(
         profile_name=f"{PROFILE_PREFIX}_ASYNC",
         attributes=async_synthetic_profile_attributes,
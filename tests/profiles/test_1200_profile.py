@@ -19,10 +19,11 @@ from select_ai import Profile, ProfileAttributes
 
 logger = logging.getLogger(__name__)
 
-PYSAI_1200_PROFILE = f"PYSAI_1200_{uuid.uuid4().hex.upper()}"
-PYSAI_1200_PROFILE_2 = f"PYSAI_1200_2_{uuid.uuid4().hex.upper()}"
-PYSAI_1200_MIN_ATTR_PROFILE = f"PYSAI_1200_MIN_{uuid.uuid4().hex.upper()}"
-PYSAI_1200_DUP_PROFILE = f"PYSAI_1200_DUP_{uuid.uuid4().hex.upper()}"
+PYSAI_1200_UUID = uuid.uuid4().hex.upper()
+PYSAI_1200_PROFILE = f"PYSAI_1200_{PYSAI_1200_UUID}"
+PYSAI_1200_PROFILE_2 = f"PYSAI_1200_2_{PYSAI_1200_UUID}"
+PYSAI_1200_MIN_ATTR_PROFILE = f"PYSAI_1200_MIN_{PYSAI_1200_UUID}"
+PYSAI_1200_DUP_PROFILE = f"PYSAI_1200_DUP_{PYSAI_1200_UUID}"
 
 
 @pytest.fixture(scope="module")
@@ -245,7 +246,7 @@ def test_1208(oci_credential, oci_compartment_id):
     ]
     assert profile.attributes.comments is True
     fetched_attributes = profile.get_attributes()
-    print(fetched_attributes.provider)
+    logger.info("Fetched provider %r", fetched_attributes.provider)
     assert fetched_attributes == profile_attrs
 
 
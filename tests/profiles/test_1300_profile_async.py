@@ -18,14 +18,13 @@ import select_ai
 from select_ai import AsyncProfile, ProfileAttributes
 
 logger = logging.getLogger(__name__)
-PYSAI_ASYNC_1300_PROFILE = f"PYSAI_ASYNC_1300_{uuid.uuid4().hex.upper()}"
-PYSAI_ASYNC_1300_PROFILE_2 = f"PYSAI_ASYNC_1300_2_{uuid.uuid4().hex.upper()}"
+PYSAI_ASYNC_1300_UUID = uuid.uuid4().hex.upper()
+PYSAI_ASYNC_1300_PROFILE = f"PYSAI_ASYNC_1300_{PYSAI_ASYNC_1300_UUID}"
+PYSAI_ASYNC_1300_PROFILE_2 = f"PYSAI_ASYNC_1300_2_{PYSAI_ASYNC_1300_UUID}"
 PYSAI_ASYNC_1300_MIN_ATTR_PROFILE = (
-    f"PYSAI_ASYNC_1300_MIN_{uuid.uuid4().hex.upper()}"
-)
-PYSAI_ASYNC_1300_DUP_PROFILE = (
-    f"PYSAI_ASYNC_1300_DUP_{uuid.uuid4().hex.upper()}"
+    f"PYSAI_ASYNC_1300_MIN_{PYSAI_ASYNC_1300_UUID}"
 )
+PYSAI_ASYNC_1300_DUP_PROFILE = f"PYSAI_ASYNC_1300_DUP_{PYSAI_ASYNC_1300_UUID}"
 
 
 @pytest.fixture(scope="module")
@@ -9,6 +9,7 @@
 1600 - Profile generate API tests
 """
 
+import itertools
 import json
 import logging
 import uuid
@@ -28,6 +29,7 @@ from select_ai.profile import Action
 logger = logging.getLogger(__name__)
 
 PROFILE_PREFIX = f"PYSAI_1600_{uuid.uuid4().hex.upper()}"
+NEGATIVE_PROFILE_IDS = itertools.count()
 
 PROMPTS = [
     "What is a database?",
@@ -58,7 +60,7 @@ def generate_profile_attributes(test_env, oci_credential, generate_provider):
 
 @pytest.fixture(scope="module")
 def generate_profile(generate_profile_attributes):
-    logger.info("Creating generate profile %s", f"{PROFILE_PREFIX}_POSITIVE")
+    logger.info("Creating generate profile %s_POSITIVE", PROFILE_PREFIX)
     profile = Profile(
         profile_name=f"{PROFILE_PREFIX}_POSITIVE",
         attributes=generate_profile_attributes,
@@ -77,7 +79,7 @@ def generate_profile(generate_profile_attributes):
 @pytest.fixture
 def negative_profile(test_env, oci_credential, generate_provider):
     logger.info("Creating negative generate profile")
-    profile_name = f"{PROFILE_PREFIX}_NEG_{uuid.uuid4().hex.upper()}"
+    profile_name = f"{PROFILE_PREFIX}_NEG_{next(NEGATIVE_PROFILE_IDS)}"
     attributes = ProfileAttributes(
         credential_name=oci_credential["credential_name"],
         provider=generate_provider,
@@ -9,6 +9,7 @@
 1700 - AsyncProfile generate API tests
 """
 
+import itertools
 import json
 import logging
 import uuid
@@ -28,6 +29,7 @@ from select_ai.profile import Action
 logger = logging.getLogger(__name__)
 
 PROFILE_PREFIX = f"PYSAI_1700_{uuid.uuid4().hex.upper()}"
+NEGATIVE_PROFILE_IDS = itertools.count()
 
 PROMPTS = [
     "What is a database?",
@@ -60,9 +62,7 @@ def async_generate_profile_attributes(
 
 @pytest.fixture(scope="module")
 async def async_generate_profile(async_generate_profile_attributes):
-    logger.info(
-        "Creating async generate profile %s", f"{PROFILE_PREFIX}_POSITIVE"
-    )
+    logger.info("Creating async generate profile %s_POSITIVE", PROFILE_PREFIX)
     profile = await AsyncProfile(
         profile_name=f"{PROFILE_PREFIX}_POSITIVE",
         attributes=async_generate_profile_attributes,
@@ -83,7 +83,7 @@ async def async_negative_profile(
     oci_credential, async_generate_provider, test_env
 ):
     logger.info("Creating async negative generate profile")
-    profile_name = f"{PROFILE_PREFIX}_NEG_{uuid.uuid4().hex.upper()}"
+    profile_name = f"{PROFILE_PREFIX}_NEG_{next(NEGATIVE_PROFILE_IDS)}"
     attributes = ProfileAttributes(
         credential_name=oci_credential["credential_name"],
         provider=async_generate_provider,
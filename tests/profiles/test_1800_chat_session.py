@@ -14,6 +14,7 @@ import uuid
 
 import pytest
 import select_ai
+from oracledb import DatabaseError
 from select_ai import (
     Conversation,
     ConversationAttributes,
@@ -74,9 +75,7 @@ def chat_session_provider(oci_compartment_id):
 
 @pytest.fixture(scope="module")
 def chat_session_profile(oci_credential, chat_session_provider):
-    logger.info(
-        "Creating chat session profile %s", f"{PROFILE_PREFIX}_PROFILE"
-    )
+    logger.info("Creating chat session profile %s_PROFILE", PROFILE_PREFIX)
     profile = Profile(
         profile_name=f"{PROFILE_PREFIX}_PROFILE",
         attributes=ProfileAttributes(
@@ -160,8 +159,12 @@ def test_1801_physics_chat_session_delete_true(
             conversation.conversation_id,
         )
         _assert_keywords(session, CATEGORY_PROMPTS["physics"])
-    with pytest.raises(Exception):
+    with pytest.raises(DatabaseError) as exc_info:
         conversation.delete()
+    (error,) = exc_info.value.args
+    logger.debug("Error code: %s", error.code)
+    logger.debug("Error message:\n%s", error.message)
+    assert error.code == 20050
 
 
 def test_1802_multiple_sessions_same_conversation(
@@ -266,7 +269,7 @@ def test_1804_special_characters(chat_session_profile, conversation_factory):
 def test_1805_invalid_conversation_object(chat_session_profile):
     """Passing non conversation object raises error"""
     logger.info("Validating invalid conversation object handling")
-    with pytest.raises(Exception):
+    with pytest.raises(AttributeError):
         with chat_session_profile.chat_session(conversation="fake-object"):
             pass
 